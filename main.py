@@ -13,8 +13,6 @@ The server provides comprehensive access to MyAnimeList data through
 the Jikan API via Model Context Protocol (MCP) tools.
 """
 
-import asyncio
-import httpx
 from src.tools.server import main
 
 def run_server() -> None:
@@ -1,10 +1,31 @@
+import sys
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional, List
 
+# Shared empty-dict sentinel so absent parent objects don't allocate per row
+_EMPTY: dict = {}
+
+
+def _intern(value):
+    """Intern low-cardinality strings (status/rating/season/type) so repeated
+    values across rows share one object instead of one fresh str each."""
+    return sys.intern(value) if value.__class__ is str else value
+
+
+def _split_refs(items) -> tuple:
+    """Split a Jikan reference list into parallel id and name lists in one pass."""
+    ids, names = [], []
+    append_id, append_name = ids.append, names.append
+    for item in items or ():
+        append_id(item.get('mal_id', 0))
+        append_name(item.get('name', ''))
+    return ids, names
+
 
 class AnimeSearchParams(BaseModel):
     """Parameters for searching anime on MyAnimeList."""
+    model_config = ConfigDict(frozen=True)
     query: str = Field(..., description="Search term for anime title or keywords", min_length=1)
     limit: Optional[int] = Field(5, description="Number of results to return", ge=1, le=25)
     status: Optional[Literal['airing', 'complete', 'upcoming']] = Field(None, description="Filter by anime status")
@@ -14,8 +35,9 @@ class AnimeSearchParams(BaseModel):
     start_date: Optional[str] = Field(None, description="Filter anime that started after this date (YYYY-MM-DD)")
     end_date: Optional[str] = Field(None, description="Filter anime that ended before this date (YYYY-MM-DD)")
 
-class AnimeSearchResponse(BaseModel):
-    """Response model for anime search results."""
+class AnimeDetailsBase(BaseModel):
+    """Shared fields and Jikan mapping for detailed anime entries."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     mal_id: Optional[int] = None
     title: Optional[str] = None
     episodes: Optional[int] = None
@@ -37,18 +59,59 @@ class AnimeSearchResponse(BaseModel):
     producers_mal_ids: Optional[List[int]] = None
     producer_names: Optional[List[str]] = None
     studio_ids: Optional[List[int]] = None
-    studio_name: Optional[List[str]] = None
+    studio_names: Optional[List[str]] = None
     genre_ids: Optional[List[int]] = None
     genre_names: Optional[List[str]] = None
 
+    @classmethod
+    def from_jikan(cls, anime: dict) -> "AnimeDetailsBase":
+        """Build a response from a raw Jikan anime entry, skipping validation."""
+        get = anime.get  # local alias; this mapping runs once per row
+        aired = get('aired') or _EMPTY
+        producer_ids, producer_names = _split_refs(get('producers'))
+        studio_ids, studio_names = _split_refs(get('studios'))
+        genre_ids, genre_names = _split_refs(get('genres'))
+        return cls.model_construct(
+            mal_id=get('mal_id', 0),
+            title=get('title', ''),
+            episodes=get('episodes', 0),
+            status=_intern(get('status', '')),
+            airing=get('airing', False),
+            start_date=aired.get('from', ''),
+            end_date=aired.get('to', ''),
+            duration=get('duration', ''),
+            rating=_intern(get('rating', '')),
+            score=get('score', 0.0),
+            scored_by=get('scored_by', 0),
+            rank=get('rank', 0),
+            popularity=get('popularity', 0),
+            favorites=get('favorites', 0),
+            synopsis=get('synopsis', ''),
+            background=get('background', ''),
+            season=_intern(get('season', '')),
+            year=get('year', 0),
+            producers_mal_ids=producer_ids,
+            producer_names=producer_names,
+            studio_ids=studio_ids,
+            studio_names=studio_names,
+            genre_ids=genre_ids,
+            genre_names=genre_names
+        )
+
+class AnimeSearchResponse(AnimeDetailsBase):
+    """Response model for anime search results."""
+
+
 class TopAnimeParams(BaseModel):
     """Parameters for filtering top anime requests."""
+    model_config = ConfigDict(frozen=True)
     filter: Optional[Literal['airing', 'upcoming', 'bypopularity', 'favorite']] = 'airing'
     ratings: Optional[Literal['g', 'pg', 'pg13', 'r17', 'r', 'rx']] = 'g'
     limit: Optional[int] = 10
 
 class TopAnimeResponse(BaseModel):
     """Response model for top anime data."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     title: Optional[str] = None
     type: Optional[str] = None
     episodes: Optional[int] = None
@@ -59,8 +122,24 @@ class TopAnimeResponse(BaseModel):
     season: Optional[str] = None
     year: Optional[int] = None
 
+    @classmethod
+    def from_jikan(cls, anime: dict) -> "TopAnimeResponse":
+        """Build a response from a raw Jikan anime entry, skipping validation."""
+        return cls.model_construct(
+            title=anime.get('title_english', ''),
+            type=_intern(anime.get('type', '')),
+            episodes=anime.get('episodes', 0),
+            status=_intern(anime.get('status', '')),
+            rating=_intern(anime.get('rating', '')),
+            rank=anime.get('rank', 0),
+            synopsis=anime.get('synopsis', ''),
+            season=_intern(anime.get('season', '')),
+            year=anime.get('year', 0)
+        )
+
 class RandomAnimeResponse(BaseModel):
     """Response model for random anime data."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     title: Optional[str] = None
     type: Optional[str] = None
     episodes: Optional[int] = None
@@ -71,55 +150,80 @@ class RandomAnimeResponse(BaseModel):
     season: Optional[str] = None
     year: Optional[int] = None
 
+    @classmethod
+    def from_jikan(cls, anime: dict) -> "RandomAnimeResponse":
+        """Build a response from a raw Jikan anime entry, skipping validation."""
+        return cls.model_construct(
+            title=anime.get('title_english', ''),
+            type=_intern(anime.get('type', '')),
+            episodes=anime.get('episodes', 0),
+            status=_intern(anime.get('status', '')),
+            rating=_intern(anime.get('rating', '')),
+            rank=anime.get('rank', 0),
+            synopsis=anime.get('synopsis', ''),
+            season=_intern(anime.get('season', '')),
+            year=anime.get('year', 0)
+        )
+
 class AnimeReviewParams(BaseModel):
     """Parameters for filtering anime review requests."""
+    model_config = ConfigDict(frozen=True)
     preliminary: Optional[bool] = True # if the anime is airing/publishing, then preliminary needs to be true
     spoilers: Optional[bool] = False
 
 class AnimeReviewResponse(BaseModel):
     """Response model for anime review data."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     review: Optional[str]
     date: Optional[str]
 
+    @classmethod
+    def from_jikan(cls, item: dict) -> "AnimeReviewResponse":
+        """Build a response from a raw Jikan review entry, skipping validation."""
+        return cls.model_construct(
+            review=item.get('review', ''),
+            date=item.get('date', '')
+        )
+
 class SimilarAnimeResponse(BaseModel):
     """Response model for anime recommendation"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     mal_id: Optional[int] = None
     title: Optional[str] = None
 
+    @classmethod
+    def from_jikan(cls, recommendation: dict) -> "SimilarAnimeResponse":
+        """Build a response from a raw Jikan recommendation entry, skipping validation."""
+        entry = recommendation.get('entry') or _EMPTY
+        return cls.model_construct(
+            mal_id=entry.get('mal_id', 0),
+            title=entry.get('title', '')
+        )
+
 class AnimeNewsResponse(BaseModel):
     """Response model for anime news"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     title: Optional[str] = None
     date: Optional[str] = None
     author_username: Optional[str] = None
     url: Optional[str] = None
     excerpt: Optional[str] = None
 
+    @classmethod
+    def from_jikan(cls, news: dict) -> "AnimeNewsResponse":
+        """Build a response from a raw Jikan news entry, skipping validation."""
+        return cls.model_construct(
+            title=news.get('title', ''),
+            date=news.get('date', ''),
+            author_username=news.get('author_username', ''),
+            url=news.get('url', ''),
+            excerpt=news.get('excerpt', '')
+        )
+
 class SeasonalAnimeParams(BaseModel):
+    model_config = ConfigDict(frozen=True)
     season: Optional[Literal['fall', 'winter', 'spring', 'summer']] = 'spring'
     year: Optional[int] = 2025
 
-class SeasonalAnimeResponse(BaseModel):
-    mal_id: Optional[int] = None
-    title: Optional[str] = None
-    episodes: Optional[int] = None
-    status: Optional[str] = None
-    airing: Optional[bool] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    duration: Optional[str] = None
-    rating: Optional[str] = None
-    score: Optional[float] = None
-    scored_by: Optional[int] = None
-    rank: Optional[int] = None
-    popularity: Optional[int] = None
-    favorites: Optional[int] = None
-    synopsis: Optional[str] = None
-    background: Optional[str] = None
-    season: Optional[str] = None
-    year: Optional[int] = None
-    producers_mal_ids: Optional[List[int]] = None
-    producer_names: Optional[List[str]] = None
-    studio_ids: Optional[List[int]] = None
-    studio_names: Optional[List[str]] = None
-    genre_ids: Optional[List[int]] = None
-    genre_names: Optional[List[str]] = None
\ No newline at end of file
+class SeasonalAnimeResponse(AnimeDetailsBase):
+    """Response model for seasonal anime data."""
@@ -1,10 +1,30 @@
+import sys
 
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional, List
 
+# Shared empty-dict sentinel so absent parent objects don't allocate per row
+_EMPTY: dict = {}
+
+
+def _intern(value):
+    """Intern low-cardinality strings (status/type) so repeated values across
+    rows share one object instead of one fresh str each."""
+    return sys.intern(value) if value.__class__ is str else value
+
+
+def _split_refs(items) -> tuple:
+    """Split a Jikan reference list into parallel id and name lists in one pass."""
+    ids, names = [], []
+    append_id, append_name = ids.append, names.append
+    for item in items or ():
+        append_id(item.get('mal_id', 0))
+        append_name(item.get('name', ''))
+    return ids, names
+
 class MangaSearchParams(BaseModel):
     """Parameters for searching manga on MyAnimeList."""
+    model_config = ConfigDict(frozen=True)
     query: str = Field(..., description="Search term for manga title or keywords", min_length=1)
     limit: Optional[int] = Field(5, description="Number of results to return", ge=1, le=25)
     status: Optional[Literal['airing', 'complete', 'upcoming']] = Field(None, description="Filter by manga status - 'airing' (currently publishing), 'complete' (finished), 'upcoming' (not yet published)")
@@ -15,6 +35,7 @@ class MangaSearchParams(BaseModel):
 
 class MangaSearchResponse(BaseModel):
     """Response model for manga search results."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     mal_id: Optional[int] = None
     title: Optional[str] = None
     volumes: Optional[int] = None
@@ -34,14 +55,44 @@ class MangaSearchResponse(BaseModel):
     genre_ids: Optional[List[int]] = None
     genre_names: Optional[List[str]] = None
 
+    @classmethod
+    def from_jikan(cls, manga: dict) -> "MangaSearchResponse":
+        """Build a response from a raw Jikan manga entry, skipping validation."""
+        get = manga.get  # local alias; this mapping runs once per row
+        published = get('published') or _EMPTY
+        author_ids, author_names = _split_refs(get('authors'))
+        genre_ids, genre_names = _split_refs(get('genres'))
+        return cls.model_construct(
+            mal_id=get('mal_id', 0),
+            title=get('title_english', ''),
+            volumes=get('volumes', 0),
+            status=_intern(get('status', '')),
+            publishing=get('publishing', False),
+            start_date=published.get('from', ''),
+            end_date=published.get('to', ''),
+            score=get('score', 0.0),
+            scored_by=get('scored_by', 0),
+            rank=get('rank', 0),
+            popularity=get('popularity', 0),
+            favorites=get('favorites', 0),
+            synopsis=get('synopsis', ''),
+            background=get('background', ''),
+            authors_mal_ids=author_ids,
+            authors_names=author_names,
+            genre_ids=genre_ids,
+            genre_names=genre_names,
+        )
+
 class TopMangaParams(BaseModel):
     """Parameters for filtering top manga requests."""
+    model_config = ConfigDict(frozen=True)
     filter: Optional[Literal['airing', 'upcoming', 'bypopularity', 'favorite']] = Field('airing', description="Ranking category - 'airing' (currently publishing), 'upcoming' (not yet published), 'bypopularity' (most popular), 'favorite' (most favorited)")
     ratings: Optional[Literal['g', 'pg', 'pg13', 'r17', 'r', 'rx']] = Field('g', description="Content rating filter")
     limit: Optional[int] = Field(10, description="Number of results to return", ge=1, le=500)
 
 class TopMangaResponse(BaseModel):
     """Response model for top manga data."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     title: Optional[str]
     type: Optional[str] = None
     volumes: Optional[int] = None
@@ -51,8 +102,23 @@ class TopMangaResponse(BaseModel):
     season: Optional[str] = None
     year: Optional[int] = None
 
+    @classmethod
+    def from_jikan(cls, manga: dict) -> "TopMangaResponse":
+        """Build a response from a raw Jikan manga entry, skipping validation."""
+        return cls.model_construct(
+            title=manga.get('title_english', ''),
+            type=_intern(manga.get('type', '')),
+            volumes=manga.get('volumes', 0),
+            status=_intern(manga.get('status', '')),
+            rank=manga.get('rank', 0),
+            synopsis=manga.get('synopsis', ''),
+            season=manga.get('season', ''),
+            year=manga.get('year', 0)
+        )
+
 class RandomMangaResponse(BaseModel):
     """Response model for random manga data."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     title: Optional[str] = None
     type: Optional[str] = None
     volumes: Optional[int] = None
@@ -62,27 +128,73 @@ class RandomMangaResponse(BaseModel):
     season: Optional[str] = None
     year: Optional[int] = None
 
+    @classmethod
+    def from_jikan(cls, manga: dict) -> "RandomMangaResponse":
+        """Build a response from a raw Jikan manga entry, skipping validation."""
+        return cls.model_construct(
+            title=manga.get('title_english', ''),
+            type=_intern(manga.get('type', '')),
+            volumes=manga.get('volumes', 0),
+            status=_intern(manga.get('status', '')),
+            rank=manga.get('rank', 0),
+            synopsis=manga.get('synopsis', ''),
+            season=manga.get('season', ''),
+            year=manga.get('year', 0)
+        )
+
 class MangaReviewParams(BaseModel):
     """Parameters for filtering manga review requests."""
+    model_config = ConfigDict(frozen=True)
     preliminary: Optional[bool] = Field(True, description="Include preliminary reviews - set to True if manga is still publishing")
     spoilers: Optional[bool] = Field(False, description="Include reviews with spoilers - set to True to include spoiler reviews")
 
 class MangaReviewResponse(BaseModel):
     """Response model for manga review data."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     review: Optional[str]
     date: Optional[str]
 
+    @classmethod
+    def from_jikan(cls, item: dict) -> "MangaReviewResponse":
+        """Build a response from a raw Jikan review entry, skipping validation."""
+        return cls.model_construct(
+            review=item.get('review', ''),
+            date=item.get('date', '')
+        )
+
 class SimilarMangaResponse(BaseModel):
     """Response model for manga recommendations"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     mal_id: Optional[int] = None
     title: Optional[str] = None
 
+    @classmethod
+    def from_jikan(cls, recommendation: dict) -> "SimilarMangaResponse":
+        """Build a response from a raw Jikan recommendation entry, skipping validation."""
+        entry = recommendation.get('entry') or _EMPTY
+        return cls.model_construct(
+            mal_id=entry.get('mal_id', 0),
+            title=entry.get('title', '')
+        )
+
 class MangaNewsResponse(BaseModel):
     """Response model for manga news"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     title: Optional[str] = None
     date: Optional[str] = None
     author_username: Optional[str] = None
     url: Optional[str] = None
     excerpt: Optional[str] = None
 
+    @classmethod
+    def from_jikan(cls, news: dict) -> "MangaNewsResponse":
+        """Build a response from a raw Jikan news entry, skipping validation."""
+        return cls.model_construct(
+            title=news.get('title', ''),
+            date=news.get('date', ''),
+            author_username=news.get('author_username', ''),
+            url=news.get('url', ''),
+            excerpt=news.get('excerpt', '')
+        )
+
 
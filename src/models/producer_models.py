@@ -1,15 +1,25 @@
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 class ProducerResourceParams(BaseModel):
     """Model for producer resource parameters"""
+    model_config = ConfigDict(frozen=True)
     query: str = Field("Toei Animation", description="Search term for producer/studio name", min_length=1)
     limit: Optional[int] = Field(5, description="Number of results to return", ge=1, le=25)
 
 class ProducerResourceResponse(BaseModel):
     """Model for producer resource response"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
     about: Optional[str] = None
     titles: Optional[List[str]] = None
 
+    @classmethod
+    def from_jikan(cls, producer_detail: dict) -> "ProducerResourceResponse":
+        """Build a response from a raw Jikan producer entry, skipping validation."""
+        return cls.model_construct(
+            about=producer_detail.get('about', ''),
+            titles=[title.get('title', '') for title in producer_detail.get('titles', [])]
+        )
+
 
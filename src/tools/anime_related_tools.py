@@ -1,13 +1,28 @@
-import httpx
+import asyncio
 
 from src.utils.logger import logger
-from src.tools.config import mcp, BASE_URL
+from src.tools.jikan import fetch_json, fetch_json_many
+from src.utils.query import to_query
+from src.utils.cache import (
+    jikan_cache, cache_key, SEARCH_TTL, TOP_TTL, SEASONAL_TTL,
+    REVIEWS_TTL, RECOMMENDATIONS_TTL, NEWS_TTL
+)
+from src.tools.config import mcp
 from src.models.anime_models import (
     AnimeNewsResponse, AnimeReviewParams, AnimeReviewResponse, AnimeSearchResponse, 
     RandomAnimeResponse, SeasonalAnimeParams, TopAnimeParams, TopAnimeResponse,
     AnimeSearchParams, SimilarAnimeResponse, SeasonalAnimeResponse
 )
 
+# Pre-bound endpoint formatters so per-id paths skip f-string assembly on each call
+_REVIEWS_PATH = "/anime/{}/reviews".format
+_RECOMMENDATIONS_PATH = "/anime/{}/recommendations".format
+_NEWS_PATH = "/anime/{}/news".format
+_SEASONAL_PATH = "/seasons/{}/{}".format
+
+# Jikan returns at most 25 items per page regardless of the requested limit
+_PAGE_SIZE = 25
+
 @mcp.tool()
 async def search_anime(params: AnimeSearchParams):
     """Search for anime on MyAnimeList based on a query string and optional filters.
@@ -64,119 +79,41 @@ async def search_anime(params: AnimeSearchParams):
     """
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        query_params = to_query(params)
 
-            # Convert Pydantic model to dict, excluding None values
-            query_params = params.model_dump(exclude_none=True)
+        key = cache_key("search_anime", query_params)
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
 
-            logger.info(f"Searching anime with params: {query_params}")
+        logger.info("Searching anime with params: %s", query_params)
 
-            try:
+        response_data = await fetch_json("/anime", params=query_params, timeout=120.0)
 
-                response = await client.get(f"{BASE_URL}/anime", params=query_params)
-                response.raise_for_status()
 
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/anime timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occured: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occured while requesting {e.request.url} : {e}")
-                raise
+        animelist = response_data.get('data', [])
 
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
+        if not isinstance(animelist, list):
+            logger.error(f"Expected 'data' to be a list, got {type(animelist)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
 
+        if not animelist:
+            return []
 
-            animelist = response_data.get('data', [])
+        logger.info("Retrieved %d anime entries", len(animelist))
 
-            if not isinstance(animelist, list):
-                logger.error(f"Expected 'data' to be a list, got {type(animelist)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
 
-            logger.info(f"Retrieved {len(animelist)} anime entries")
-
-
-            logger.info(f"anime list: {animelist}")
-
-
-            result = list()
-
-            for idx, anime in enumerate(animelist):
-
-                try:
-                    if not isinstance(anime, dict):
-                        logger.warning(f"Skipping anime at index {idx}: not a dict")
-                        continue
-
-                    anime_response = AnimeSearchResponse(
-                    mal_id=anime.get('mal_id', 0),
-                    title=anime.get('title', ''),
-                    episodes=anime.get('episodes', 0),
-                    status=anime.get('status', ''),
-                    airing=anime.get('airing', False),
-                    start_date=anime.get('aired', {}).get('from', ''),
-                    end_date=anime.get('aired', {}).get('to', ''),
-                    duration=anime.get('duration', ''),
-                    rating=anime.get('rating', ''),
-                    score=anime.get('score', 0.0),
-                    scored_by=anime.get('scored_by', 0),
-                    rank=anime.get('rank', 0),
-                    popularity=anime.get('popularity', 0),
-                    favorites=anime.get('favorites', 0),
-                    synopsis=anime.get('synopsis', ''),
-                    background=anime.get('background', ''),
-                    season=anime.get('season', ''),
-                    year=anime.get('year', 0),
-                    producer_mal_ids=[
-                        producer.get('mal_id', 0) 
-                        for producer in anime.get('producers', []) 
-                        if isinstance(producer, dict)
-                    ],
-                    producer_names=[
-                        producer.get('name', '') 
-                        for producer in anime.get('producers', []) 
-                        if isinstance(producer, dict)
-                    ],
-                    studio_ids=[
-                        studio.get('mal_id', 0) 
-                        for studio in anime.get('studios', []) 
-                        if isinstance(studio, dict)
-                    ],
-                    studio_names=[
-                        studio.get('name', '') 
-                        for studio in anime.get('studios', []) 
-                        if isinstance(studio, dict)
-                    ],
-                    genre_ids=[
-                        genre.get('mal_id', 0) 
-                        for genre in anime.get('genres', []) 
-                        if isinstance(genre, dict)
-                    ],
-                    genre_names=[
-                        genre.get('name', '') 
-                        for genre in anime.get('genres', []) 
-                        if isinstance(genre, dict)
-                    ]
-                    )
-
-                    result.append(anime_response)
-
-                except Exception as e:
-                    logger.warning(f"Failed to process anime at index {idx} (mal_id: {anime.get('mal_id', 'unknown')}) : {e} ")
-                    continue
-
-            logger.info(f"Successfully processed {len(result)} out of {len(animelist)} anime entries")
-
-            return result
+
+        result = [AnimeSearchResponse.from_jikan(anime) for anime in animelist if isinstance(anime, dict)]
+
+        logger.info("Successfully processed %d out of %d anime entries", len(result), len(animelist))
+
+        jikan_cache.set(key, result, SEARCH_TTL)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while fetching anime information: {e}", exc_info=True)
+        logger.error("Error occured while fetching anime information: %s", e)
         raise
 
 @mcp.tool()
@@ -221,31 +158,36 @@ async def get_top_anime(params: TopAnimeParams):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-
-            # Convert Pydantic model to dict, excluding None values
-            query_params = params.model_dump(exclude_none=True)
-
-            logger.info(f"params: {query_params}")
-
-            try:
-                response = await client.get(f"{BASE_URL}/top/anime", params=query_params)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/top/anime timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
+        query_params = to_query(params)
+
+        key = cache_key("top_anime", query_params)
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        logger.info("params: %s", query_params)
+
+        limit = query_params.get('limit') or 10
+
+        if limit > _PAGE_SIZE:
+            # Jikan caps pages at 25 items, so larger limits need several
+            # pages; fetch them concurrently instead of paying serial RTTs
+            pages = -(-limit // _PAGE_SIZE)
+            responses = await fetch_json_many(
+                [("/top/anime", {**query_params, 'limit': _PAGE_SIZE, 'page': page})
+                 for page in range(1, pages + 1)],
+                timeout=120.0,
+            )
+            animelist = []
+            for response_data in responses:
+                page_data = response_data.get('data', [])
+                if not isinstance(page_data, list):
+                    logger.error(f"Expected 'data' to be a list, got {type(page_data)}")
+                    raise ValueError("Invalid API response format: 'data' is not a list")
+                animelist.extend(page_data)
+            animelist = animelist[:limit]
+        else:
+            response_data = await fetch_json("/top/anime", params=query_params, timeout=120.0)
 
             animelist = response_data.get('data', [])
 
@@ -253,24 +195,17 @@ async def get_top_anime(params: TopAnimeParams):
                 logger.error(f"Expected 'data' to be a list, got {type(animelist)}")
                 raise ValueError("Invalid API response format: 'data' is not a list")
 
-            result = [TopAnimeResponse(
-                title = anime.get('title_english', ''),
-                type = anime.get('type', ''),
-                episodes = anime.get('episodes', 0),
-                status = anime.get('status', ''),
-                rating = anime.get('rating', ''),
-                rank = anime.get('rank', 0),
-                synopsis = anime.get('synopsis', ''),
-                season = anime.get('season', ''),
-                year = anime.get('year', 0)
-            ) for anime in animelist]
+        if not animelist:
+            return []
+
+        result = [TopAnimeResponse.from_jikan(anime) for anime in animelist]
 
-            logger.info(f"Top Anime Fetched:\n {result}...")
+        jikan_cache.set(key, result, TOP_TTL)
 
-            return result
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while fetching top anime: {e}", exc_info=True)
+        logger.error("Error occured while fetching top anime: %s", e)
         raise
 
 @mcp.tool()
@@ -301,51 +236,20 @@ async def get_random_anime():
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/random/anime")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/random/anime timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            anime = response_data.get('data', {})
-
-            if not isinstance(anime, dict):
-                logger.error(f"Expected 'data' to be a dict, got {type(anime)}")
-                raise ValueError("Invalid API response format: 'data' is not a dict")
-
-            result = RandomAnimeResponse(
-                title = anime.get('title_english', ''),
-                type = anime.get('type', ''),
-                episodes = anime.get('episodes', 0),
-                status = anime.get('status', ''),
-                rating = anime.get('rating', ''),
-                rank = anime.get('rank', 0),
-                synopsis = anime.get('synopsis', ''),
-                season = anime.get('season', ''),
-                year = anime.get('year', 0)
-            )
+        response_data = await fetch_json("/random/anime")
+
+        anime = response_data.get('data', {})
 
-            logger.info(f"A random anime Fetched:\n {result}")
+        if not isinstance(anime, dict):
+            logger.error(f"Expected 'data' to be a dict, got {type(anime)}")
+            raise ValueError("Invalid API response format: 'data' is not a dict")
 
-            return result
+        result = RandomAnimeResponse.from_jikan(anime)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while fetching a random anime: {e}", exc_info=True)
+        logger.error("Error occured while fetching a random anime: %s", e)
         raise
 
 @mcp.tool()
@@ -382,47 +286,32 @@ async def get_anime_reviews(id: int, params: AnimeReviewParams):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            # Convert Pydantic model to dict, excluding None values
-            query_params = params.model_dump(exclude_none=True)
-
-            try:
-                response = await client.get(f"{BASE_URL}/anime/{id}/reviews", params=query_params)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/anime/{id}/reviews timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            data = response_data.get('data', [])
-
-            if not isinstance(data, list):
-                logger.error(f"Expected 'data' to be a list, got {type(data)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        query_params = to_query(params)
+
+        key = cache_key("anime_reviews", {"id": id, **query_params})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response_data = await fetch_json(_REVIEWS_PATH(id), params=query_params)
+
+        data = response_data.get('data', [])
 
-            result = [AnimeReviewResponse(
-                review = item.get('review', ''),
-                date = item.get('date', '')
-            ) for item in data]
+        if not isinstance(data, list):
+            logger.error(f"Expected 'data' to be a list, got {type(data)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
 
-            logger.info(f"Reviews for the anime with MAL_ID {id} fetched: {result}...")
+        if not data:
+            return []
 
-            return result
+        result = [AnimeReviewResponse.from_jikan(item) for item in data]
+
+        jikan_cache.set(key, result, REVIEWS_TTL)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while fetching anime review: {e}", exc_info=True)
+        logger.error("Error occured while fetching anime review: %s", e)
         raise
 
 @mcp.tool()
@@ -459,42 +348,30 @@ async def get_similar_anime(id: int):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/anime/{id}/recommendations")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/anime/{id}/recommendations timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            anime_recommendations = response_data.get('data', [])
-
-            if not isinstance(anime_recommendations, list):
-                logger.error(f"Expected 'data' to be a list, got {type(anime_recommendations)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        key = cache_key("similar_anime", {"id": id})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response_data = await fetch_json(_RECOMMENDATIONS_PATH(id))
+
+        anime_recommendations = response_data.get('data', [])
 
-            result = [SimilarAnimeResponse(
-                mal_id = recommendation.get('entry', {}).get('mal_id', 0),
-                title = recommendation.get('entry', {}).get('title', '')
-            ) for recommendation in anime_recommendations]
+        if not isinstance(anime_recommendations, list):
+            logger.error(f"Expected 'data' to be a list, got {type(anime_recommendations)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
 
-            return result
+        if not anime_recommendations:
+            return []
+
+        result = [SimilarAnimeResponse.from_jikan(recommendation) for recommendation in anime_recommendations]
+
+        jikan_cache.set(key, result, RECOMMENDATIONS_TTL)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while getting anime recommendations: {e}", exc_info=True)
+        logger.error("Error occured while getting anime recommendations: %s", e)
         raise
 
 @mcp.tool()
@@ -530,45 +407,30 @@ async def get_anime_news(id: int):
     """
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/anime/{id}/news")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/anime/{id}/news timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            news_list = response_data.get('data', [])
-
-            if not isinstance(news_list, list):
-                logger.error(f"Expected 'data' to be a list, got {type(news_list)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        key = cache_key("anime_news", {"id": id})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response_data = await fetch_json(_NEWS_PATH(id))
+
+        news_list = response_data.get('data', [])
+
+        if not isinstance(news_list, list):
+            logger.error(f"Expected 'data' to be a list, got {type(news_list)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
+
+        if not news_list:
+            return []
+
+        result = [AnimeNewsResponse.from_jikan(news) for news in news_list]
 
-            result = [AnimeNewsResponse(
-                title = news.get('title', ''),
-                date = news.get('date', ''),
-                author_username = news.get('author_username', ''),
-                url = news.get('url', ''),
-                excerpt = news.get('excerpt', '')
-            ) for news in news_list]
+        jikan_cache.set(key, result, NEWS_TTL)
 
-            return result
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while getting anime news: {e}", exc_info=True)
+        logger.error("Error occured while getting anime news: %s", e)
         raise
 
 @mcp.tool()
@@ -616,87 +478,79 @@ async def get_seasonal_anime(params: SeasonalAnimeParams):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/seasons/{params.year}/{params.season}")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/seasons/{params.year}/{params.season} timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
+        key = cache_key("seasonal_anime", {"season": params.season, "year": params.year})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
 
-            animelist = response_data.get('data', [])
+        response_data = await fetch_json(_SEASONAL_PATH(params.year, params.season))
 
-            if not isinstance(animelist, list):
-                logger.error(f"Expected 'data' to be a list, got {type(animelist)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        animelist = response_data.get('data', [])
+
+        if not isinstance(animelist, list):
+            logger.error(f"Expected 'data' to be a list, got {type(animelist)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
 
-            result = [SeasonalAnimeResponse(
-                mal_id = anime.get('mal_id', 0),
-                title = anime.get('title', ''),
-                episodes = anime.get('episodes', 0),
-                status = anime.get('status', ''),
-                airing = anime.get('airing', False),
-                start_date = anime.get('aired', {}).get('from', ''),
-                end_date = anime.get('aired', {}).get('to',''),
-                duration = anime.get('duration', ''),
-                rating = anime.get('rating', ''),
-                score = anime.get('score', 0.0), 
-                scored_by = anime.get('scored_by', 0),
-                rank = anime.get('rank', 0),
-                popularity = anime.get('popularity', 0),
-                favorites = anime.get('favorites', 0),
-                synopsis = anime.get('synopsis', ''),
-                background = anime.get('background', ''),
-                season = anime.get('season', ''),
-                year = anime.get('year', 0),
-                producers_mal_ids = [
-                    producer.get('mal_id', 0) 
-                    for producer in anime.get('producers', []) 
-                    if isinstance(producer, dict)
-                ],
-                producer_names = [
-                    producer.get('name', '') 
-                    for producer in anime.get('producers', []) 
-                    if isinstance(producer, dict)
-                ],
-                studio_ids = [
-                    studio.get('mal_id', 0) 
-                    for studio in anime.get('studios', []) 
-                    if isinstance(studio, dict)
-                ],
-                studio_names = [
-                    studio.get('name', '') 
-                    for studio in anime.get('studios', []) 
-                    if isinstance(studio, dict)
-                ],
-                genre_ids = [
-                    genre.get('mal_id', 0) 
-                    for genre in anime.get('genres', []) 
-                    if isinstance(genre, dict)
-                ],
-                genre_names = [
-                    genre.get('name', '') 
-                    for genre in anime.get('genres', []) 
-                    if isinstance(genre, dict)
-                ]
-            ) for anime in animelist]
-
-            return result
+        if not animelist:
+            return []
+
+        result = [SeasonalAnimeResponse.from_jikan(anime) for anime in animelist]
+
+        jikan_cache.set(key, result, SEASONAL_TTL)
+
+        return result
 
 
     except Exception as e:
-        logger.error(f"Error occured while fetching seasonal anime: {e}", exc_info=True)
-        raise
\ No newline at end of file
+        logger.error("Error occured while fetching seasonal anime: %s", e)
+        raise
+@mcp.tool()
+async def get_anime_bundle(id: int, params: AnimeReviewParams):
+    """Get reviews, similar anime, and news for a specific anime in one call.
+
+    This tool fetches the three per-anime resources (user reviews, similar
+    anime recommendations, and news articles) concurrently, so the total
+    wall time is one Jikan round trip instead of three sequential calls.
+
+    CRITICAL INSTRUCTIONS FOR LLM:
+    - This tool REQUIRES a numeric MAL ID
+    - NEVER use search_anime to get MAL IDs (it returns incorrect results)
+    - If you don't have the MAL ID, you MUST follow this workflow:
+      1. Use web_search with query: "{anime_name} MyAnimeList ID"
+      2. Extract the numeric ID from the search results
+      3. Then call this function with that ID
+
+    When to Use This Tool:
+      The user wants a full picture of one anime (opinions + similar titles + news)
+      You would otherwise call get_anime_reviews, get_similar_anime and
+      get_anime_news back to back for the same ID
+
+    Args:
+        id (int): REQUIRED - The MyAnimeList ID of the anime
+                 Example IDs: Attack on Titan=16498, Trigun=6, Cowboy Bebop=1
+        params (AnimeReviewParams): Review filtering parameters including:
+            - preliminary (bool): Include preliminary reviews (default: True)
+            - spoilers (bool): Include reviews with spoilers (default: False)
+
+    Returns:
+        dict: Mapping with three keys:
+            - reviews (List[AnimeReviewResponse]): User reviews
+            - similar (List[SimilarAnimeResponse]): Similar anime recommendations
+            - news (List[AnimeNewsResponse]): Latest news articles
+
+    Raises:
+        Exception: If any of the underlying fetches fails.
+    """
+
+    try:
+        reviews, similar, news = await asyncio.gather(
+            get_anime_reviews(id, params),
+            get_similar_anime(id),
+            get_anime_news(id),
+        )
+
+        return {"reviews": reviews, "similar": similar, "news": news}
+
+    except Exception as e:
+        logger.error("Error occured while fetching the anime bundle: %s", e)
+        raise
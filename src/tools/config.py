@@ -1,7 +1,34 @@
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 
+@asynccontextmanager
+async def _warmup_lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Warm the HTTP connection pool when the server starts.
+
+    The first tool call would otherwise pay DNS resolution plus the
+    TCP/TLS handshake against the Jikan host (easily 100-300 ms). A
+    best-effort request at startup leaves an idle keep-alive connection
+    in the pool so the first real query skips all of that.
+
+    On shutdown the shared client is closed here, on the same event loop
+    that served its connections, so the pool is released cleanly.
+    """
+    try:
+        await http_client.get(f"{BASE_URL}/", timeout=5.0)
+    except Exception:
+        # Warmup is opportunistic; the first tool call simply pays the
+        # handshake itself if the upstream is unreachable right now.
+        pass
+    try:
+        yield
+    finally:
+        await close_http_client()
+
 def load_environment_config() -> tuple[str, FastMCP]:
     """Load environment configuration and initialize MCP server.
     
@@ -25,9 +52,34 @@ def load_environment_config() -> tuple[str, FastMCP]:
     if not base_url:
         raise ValueError("BASE_URL environment variable is required")
     
-    mcp_server = FastMCP("MAL_MCP_Server")
+    mcp_server = FastMCP("MAL_MCP_Server", lifespan=_warmup_lifespan)
     
     return base_url, mcp_server
 
 # Load configuration
-BASE_URL, mcp = load_environment_config()
\ No newline at end of file
+BASE_URL, mcp = load_environment_config()
+
+# Shared HTTP client for all Jikan API calls. Reusing one client keeps the
+# TCP/TLS connection pool warm across tool invocations instead of paying the
+# handshake cost on every request. The pool is sized to the fetch layer's
+# 3-request rate cap (Jikan allows ~3 req/s), so idle connections are never
+# opened just to sit in the pool.
+# A stalled connect should fail fast rather than holding a worker coroutine
+# for the full read budget; Jikan normally connects in well under a second.
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(connect=5.0, read=30.0, write=5.0, pool=5.0),
+    limits=httpx.Limits(
+        max_connections=3,
+        max_keepalive_connections=3,
+        keepalive_expiry=30.0,
+    ),
+)
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connection pool.
+
+    Should be called once during server shutdown so pooled connections
+    are released cleanly before the event loop goes away.
+    """
+    await http_client.aclose()
\ No newline at end of file
@@ -0,0 +1,136 @@
+import asyncio
+
+import httpx
+import orjson
+
+from src.utils.logger import logger
+from src.tools.config import BASE_URL, http_client
+
+DEFAULT_TIMEOUT = 30.0
+
+# Jikan rate-limits at roughly 3 requests per second; capping concurrency
+# here keeps bursts from tripping 429s in the first place
+_rate_limiter = asyncio.Semaphore(3)
+
+# In-flight request table so concurrent duplicate calls share one response
+_inflight: dict[str, asyncio.Task] = {}
+
+# Last ETag and decoded body per request key; unchanged resources revalidate
+# with a 304 instead of re-downloading the full response body
+_etag_cache: dict[str, tuple[str, dict]] = {}
+_ETAG_CACHE_MAXSIZE = 512
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+
+
+CONNECT_TIMEOUT = 5.0
+
+
+async def _request_json(key: str, url: str, params: dict | None, timeout: float) -> dict:
+    """Issue one GET (with 429 retries) and return the decoded JSON body."""
+
+    # Per-request overrides stretch only the read budget; connects should
+    # still fail fast even for the slow search/top endpoints
+    timeout = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+
+    cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with _rate_limiter:
+                response = await http_client.get(url, params=params, timeout=timeout, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                return cached[1]
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            logger.error(f"Request to {url} timed out")
+            raise
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429 and attempt < MAX_RETRIES:
+                retry_after = e.response.headers.get("Retry-After")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = BACKOFF_BASE * (2 ** attempt)
+                logger.warning("Rate limited on %s, retrying in %.2fs (attempt %d/%d)",
+                               url, delay, attempt + 1, MAX_RETRIES)
+                await asyncio.sleep(delay)
+                continue
+            logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
+            raise
+        except httpx.RequestError as e:
+            logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
+            raise
+
+        try:
+            body = orjson.loads(response.content)
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            raise ValueError(f"Invalid JSON response from API: {e}")
+
+        etag = response.headers.get("ETag")
+        if etag:
+            if len(_etag_cache) >= _ETAG_CACHE_MAXSIZE:
+                _etag_cache.pop(next(iter(_etag_cache)))
+            _etag_cache[key] = (etag, body)
+        return body
+
+
+async def fetch_json(path: str, params: dict | None = None, timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """GET a Jikan endpoint and return the decoded JSON body.
+
+    This is the single entry point for all Jikan HTTP traffic. It routes
+    requests through the shared client, holds bursts under the upstream
+    rate limit, retries 429 responses with exponential backoff (honoring
+    Retry-After when present), and coalesces concurrent duplicate calls
+    so identical in-flight requests share one response.
+
+    Args:
+        path (str): Endpoint path relative to BASE_URL, e.g. "/anime"
+        params (dict | None): Optional query parameters
+        timeout (float): Per-request timeout in seconds
+
+    Returns:
+        dict: The decoded JSON response body
+
+    Raises:
+        httpx.TimeoutException: If the request times out
+        httpx.HTTPStatusError: If the API returns a 4xx/5xx status code
+        httpx.RequestError: If there's a network error
+        ValueError: If the API response is not valid JSON
+    """
+
+    url = f"{BASE_URL}{path}"
+    key = url if not params else f"{url}?{sorted(params.items())}"
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_request_json(key, url, params, timeout))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    return await task
+
+
+async def fetch_json_many(requests: list[tuple[str, dict | None]], timeout: float = DEFAULT_TIMEOUT) -> list[dict]:
+    """GET several Jikan endpoints concurrently and return their JSON bodies.
+
+    Used by tools that fan out over multiple pages or endpoints. The
+    requests run through fetch_json, so the rate-limit semaphore still
+    caps how many are actually on the wire at once and duplicates are
+    coalesced; a wide gather degrades gracefully instead of tripping
+    429s.
+
+    Args:
+        requests (list[tuple[str, dict | None]]): (path, params) pairs
+        timeout (float): Per-request timeout in seconds
+
+    Returns:
+        list[dict]: Decoded JSON bodies in the same order as the requests
+    """
+
+    return await asyncio.gather(
+        *(fetch_json(path, params=params, timeout=timeout) for path, params in requests)
+    )
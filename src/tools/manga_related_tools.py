@@ -1,13 +1,30 @@
-
-import httpx
+import asyncio
 
 from src.utils.logger import logger
-from src.tools.config import mcp, BASE_URL
+from src.tools.jikan import fetch_json, fetch_json_many
+from src.utils.query import to_query
+from src.utils.cache import (
+    jikan_cache, cache_key, SEARCH_TTL, TOP_TTL,
+    REVIEWS_TTL, RECOMMENDATIONS_TTL, NEWS_TTL
+)
+from src.tools.config import mcp
 from src.models.manga_models import (
     MangaNewsResponse, TopMangaParams, TopMangaResponse, RandomMangaResponse, MangaReviewParams,
     MangaReviewResponse, MangaSearchParams, MangaSearchResponse, SimilarMangaResponse
 )
 
+# Pre-bound endpoint formatters so per-id paths skip f-string assembly on each call
+_REVIEWS_PATH = "/manga/{}/reviews".format
+_RECOMMENDATIONS_PATH = "/manga/{}/recommendations".format
+_NEWS_PATH = "/manga/{}/news".format
+
+# Jikan returns at most 25 items per page regardless of the requested limit
+_PAGE_SIZE = 25
+
+# Strong references to fire-and-forget prefetch tasks; the event loop only
+# keeps weak ones, so an unreferenced task could be garbage-collected mid-run
+_background_tasks: set[asyncio.Task] = set()
+
 @mcp.tool()
 async def search_manga(params: MangaSearchParams):
     """Search for manga on MyAnimeList based on a query string and optional filters.
@@ -59,77 +76,39 @@ async def search_manga(params: MangaSearchParams):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            # convert pydantic model to dict, excluding None values
-            query_params = params.model_dump(exclude_none=True)
-
-            try:
-                response = await client.get(f"{BASE_URL}/manga", params=query_params)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/manga timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
+        query_params = to_query(params)
 
-            mangalist = response_data.get('data', [])
+        key = cache_key("search_manga", query_params)
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
 
-            if not isinstance(mangalist, list):
-                logger.error(f"Expected 'data' to be a list, got {type(mangalist)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        response_data = await fetch_json("/manga", params=query_params)
 
-            result = [MangaSearchResponse(
-                mal_id = manga.get('mal_id', 0),
-                title = manga.get('title_english', ''),
-                volumes = manga.get('volumes', 0),
-                status = manga.get('status', ''),
-                publishing = manga.get('publishing', False),
-                start_date = manga.get('published', {}).get('from', ''),
-                end_date = manga.get('published', {}).get('to', ''),
-                score = manga.get('score', 0.0),
-                scored_by = manga.get('scored_by', 0),
-                rank = manga.get('rank', 0),
-                popularity = manga.get('popularity', 0),
-                favorites = manga.get('favorites', 0),
-                synopsis = manga.get('synopsis', ''),
-                background = manga.get('background', ''),
-                authors_mal_ids = [
-                    author.get('mal_id', 0) 
-                    for author in manga.get('authors', []) 
-                    if isinstance(author, dict)
-                ],
-                authors_names = [
-                    author.get('name', '') 
-                    for author in manga.get('authors', []) 
-                    if isinstance(author, dict)
-                ],
-                genre_ids = [
-                    genre.get('mal_id', 0) 
-                    for genre in manga.get('genres', []) 
-                    if isinstance(genre, dict)
-                ],
-                genre_names = [
-                    genre.get('name', '') 
-                    for genre in manga.get('genres', []) 
-                    if isinstance(genre, dict)
-                ],
-            ) for manga in mangalist]
-
-            return result
+        mangalist = response_data.get('data', [])
+
+        if not isinstance(mangalist, list):
+            logger.error(f"Expected 'data' to be a list, got {type(mangalist)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
+
+        if not mangalist:
+            return []
+
+        result = [MangaSearchResponse.from_jikan(manga) for manga in mangalist]
+
+        jikan_cache.set(key, result, SEARCH_TTL)
+
+        if result[0].mal_id:
+            # A follow-up call for the top hit is likely; warm its cache
+            # entries in the background without delaying this response
+            task = asyncio.create_task(_prefetch_manga_details(result[0].mal_id))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while searching for a manga: {e}", exc_info=True)
+        logger.error("Error occured while searching for a manga: %s", e)
         raise
 
 @mcp.tool()
@@ -174,29 +153,33 @@ async def get_top_manga(params: TopMangaParams):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            # Convert Pydantic model to dict, excluding None values
-            query_params = params.model_dump(exclude_none=True)
-
-            try:
-                response = await client.get(f"{BASE_URL}/top/manga", params=query_params)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/top/manga timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
+        query_params = to_query(params)
+
+        key = cache_key("top_manga", query_params)
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        limit = query_params.get('limit') or 10
+
+        if limit > _PAGE_SIZE:
+            # Jikan caps pages at 25 items, so larger limits need several
+            # pages; fetch them concurrently instead of paying serial RTTs
+            pages = -(-limit // _PAGE_SIZE)
+            responses = await fetch_json_many(
+                [("/top/manga", {**query_params, 'limit': _PAGE_SIZE, 'page': page})
+                 for page in range(1, pages + 1)]
+            )
+            mangalist = []
+            for response_data in responses:
+                page_data = response_data.get('data', [])
+                if not isinstance(page_data, list):
+                    logger.error(f"Expected 'data' to be a list, got {type(page_data)}")
+                    raise ValueError("Invalid API response format: 'data' is not a list")
+                mangalist.extend(page_data)
+            mangalist = mangalist[:limit]
+        else:
+            response_data = await fetch_json("/top/manga", params=query_params)
 
             mangalist = response_data.get('data', [])
 
@@ -204,24 +187,17 @@ async def get_top_manga(params: TopMangaParams):
                 logger.error(f"Expected 'data' to be a list, got {type(mangalist)}")
                 raise ValueError("Invalid API response format: 'data' is not a list")
 
-            result = [TopMangaResponse(
-                title = manga.get('title_english', ''),
-                type = manga.get('type', ''),
-                volumes = manga.get('volumes', 0),
-                status =  manga.get('status', ''),
-                rank = manga.get('rank', 0),
-                synopsis = manga.get('synopsis', ''),
-                season = manga.get('season', ''),
-                year = manga.get('year', 0)
+        if not mangalist:
+            return []
 
-            ) for manga in mangalist]
+        result = [TopMangaResponse.from_jikan(manga) for manga in mangalist]
 
-            logger.info(f"Top Manga Fetched:\n {result}...")
+        jikan_cache.set(key, result, TOP_TTL)
 
-            return result
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while fetching top manga: {e}", exc_info=True)
+        logger.error("Error occured while fetching top manga: %s", e)
         raise
 
 @mcp.tool()
@@ -253,50 +229,20 @@ async def get_random_manga():
     """
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/random/manga")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/random/manga timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            manga = response_data.get('data', {})
-
-            if not isinstance(manga, dict):
-                logger.error(f"Expected 'data' to be a dict, got {type(manga)}")
-                raise ValueError("Invalid API response format: 'data' is not a dict")
-
-            result = RandomMangaResponse(
-                title = manga.get('title_english', ''),
-                type = manga.get('type', ''),
-                volumes = manga.get('volumes', 0),
-                status =  manga.get('status', ''),
-                rank = manga.get('rank', 0),
-                synopsis = manga.get('synopsis', ''),
-                season = manga.get('season', ''),
-                year = manga.get('year', 0)
-            )
+        response_data = await fetch_json("/random/manga")
+
+        manga = response_data.get('data', {})
 
-            logger.info(f"A random manga Fetched:\n {result}")
+        if not isinstance(manga, dict):
+            logger.error(f"Expected 'data' to be a dict, got {type(manga)}")
+            raise ValueError("Invalid API response format: 'data' is not a dict")
 
-            return result
+        result = RandomMangaResponse.from_jikan(manga)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while fetching random manga", exc_info=True)
+        logger.error("Error occured while fetching random manga: %s", e)
         raise
 
 @mcp.tool()
@@ -333,47 +279,32 @@ async def get_manga_reviews(id: int, params: MangaReviewParams):
     """
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            # Convert Pydantic model to dict, excluding None values
-            query_params = params.model_dump(exclude_none=True)
-
-            try:
-                response = await client.get(f"{BASE_URL}/manga/{id}/reviews", params=query_params)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/manga/{id}/reviews timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            data = response_data.get('data', [])
-
-            if not isinstance(data, list):
-                logger.error(f"Expected 'data' to be a list, got {type(data)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        query_params = to_query(params)
+
+        key = cache_key("manga_reviews", {"id": id, **query_params})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response_data = await fetch_json(_REVIEWS_PATH(id), params=query_params)
+
+        data = response_data.get('data', [])
 
-            result = [MangaReviewResponse(
-                review = item.get('review', ''),
-                date = item.get('date', '')
-            ) for item in data]
+        if not isinstance(data, list):
+            logger.error(f"Expected 'data' to be a list, got {type(data)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
 
-            logger.info(f"Reviews for the manga with MAL_ID {id} fetched: {result}...")
+        if not data:
+            return []
 
-            return result
+        result = [MangaReviewResponse.from_jikan(item) for item in data]
+
+        jikan_cache.set(key, result, REVIEWS_TTL)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while getting manga review: {e}", exc_info=True)
+        logger.error("Error occured while getting manga review: %s", e)
         raise
 
 @mcp.tool()
@@ -410,42 +341,30 @@ async def get_similar_manga(id: int):
     """
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/manga/{id}/recommendations")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/manga/{id}/recommendations timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
+        key = cache_key("similar_manga", {"id": id})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
 
-            mangalist = response_data.get('data', [])
+        response_data = await fetch_json(_RECOMMENDATIONS_PATH(id))
 
-            if not isinstance(mangalist, list):
-                logger.error(f"Expected 'data' to be a list, got {type(mangalist)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        mangalist = response_data.get('data', [])
+
+        if not isinstance(mangalist, list):
+            logger.error(f"Expected 'data' to be a list, got {type(mangalist)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
+
+        if not mangalist:
+            return []
+
+        result = [SimilarMangaResponse.from_jikan(manga) for manga in mangalist]
 
-            result = [SimilarMangaResponse(
-                mal_id = manga.get('entry', {}).get('mal_id', 0),
-                title = manga.get('entry', {}).get('title', '')
-            ) for manga in mangalist]
+        jikan_cache.set(key, result, RECOMMENDATIONS_TTL)
 
-            return result
+        return result
 
     except Exception as e:
-        logger.error(f"Error occured while getting the manga recommendations: {e}", exc_info=True)
+        logger.error("Error occured while getting the manga recommendations: %s", e)
         raise
 
 @mcp.tool()
@@ -481,43 +400,89 @@ async def get_manga_news(id: int):
     """
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-
-            try:
-                response = await client.get(f"{BASE_URL}/manga/{id}/news")
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(f"Request to {BASE_URL}/manga/{id}/news timed out")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred while requesting {e.request.url}: {e}")
-                raise
-
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise ValueError(f"Invalid JSON response from API: {e}")
-
-            news_list = response_data.get('data', [])
-
-            if not isinstance(news_list, list):
-                logger.error(f"Expected 'data' to be a list, got {type(news_list)}")
-                raise ValueError("Invalid API response format: 'data' is not a list")
+        key = cache_key("manga_news", {"id": id})
+        cached = jikan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response_data = await fetch_json(_NEWS_PATH(id))
+
+        news_list = response_data.get('data', [])
+
+        if not isinstance(news_list, list):
+            logger.error(f"Expected 'data' to be a list, got {type(news_list)}")
+            raise ValueError("Invalid API response format: 'data' is not a list")
 
-            result = [MangaNewsResponse(
-                title = news.get('title', ''),
-                date = news.get('date', ''),
-                author_username = news.get('author_username', ''),
-                url = news.get('url', ''),
-                excerpt = news.get('excerpt', '')
-            ) for news in news_list]
+        if not news_list:
+            return []
 
-            return result
+        result = [MangaNewsResponse.from_jikan(news) for news in news_list]
 
+        jikan_cache.set(key, result, NEWS_TTL)
+
+        return result
+
+    except Exception as e:
+        logger.error("Error occured while getting manga news: %s", e)
+        raise
+@mcp.tool()
+async def get_manga_bundle(id: int, params: MangaReviewParams):
+    """Get reviews, similar manga, and news for a specific manga in one call.
+
+    This tool fetches the three per-manga resources (user reviews, similar
+    manga recommendations, and news articles) concurrently, so the total
+    wall time is one Jikan round trip instead of three sequential calls.
+
+    CRITICAL INSTRUCTIONS FOR LLM:
+    - This tool REQUIRES a numeric MAL ID
+    - NEVER use search_manga to get MAL IDs (it returns incorrect results)
+    - If you don't have the MAL ID, you MUST follow this workflow:
+      1. Use web_search with query: "{manga_name} MyAnimeList ID"
+      2. Extract the numeric ID from the search results
+      3. Then call this function with that ID
+
+    When to Use This Tool:
+      The user wants a full picture of one manga (opinions + similar titles + news)
+      You would otherwise call get_manga_reviews, get_similar_manga and
+      get_manga_news back to back for the same ID
+
+    Args:
+        id (int): REQUIRED - The MyAnimeList ID of the manga
+                 Example IDs: Berserk=2, One Piece=13, Monster=1
+        params (MangaReviewParams): Review filtering parameters including:
+            - preliminary (bool): Include preliminary reviews (default: True)
+            - spoilers (bool): Include reviews with spoilers (default: False)
+
+    Returns:
+        dict: Mapping with three keys:
+            - reviews (List[MangaReviewResponse]): User reviews
+            - similar (List[SimilarMangaResponse]): Similar manga recommendations
+            - news (List[MangaNewsResponse]): Latest news articles
+
+    Raises:
+        Exception: If any of the underlying fetches fails.
+    """
+
+    try:
+        reviews, similar, news = await asyncio.gather(
+            get_manga_reviews(id, params),
+            get_similar_manga(id),
+            get_manga_news(id),
+        )
+
+        return {"reviews": reviews, "similar": similar, "news": news}
+
+    except Exception as e:
+        logger.error("Error occured while fetching the manga bundle: %s", e)
+        raise
+
+async def _prefetch_manga_details(id: int) -> None:
+    """Best-effort cache warm for the tools typically called after a search.
+
+    Runs as a fire-and-forget task; failures are logged and dropped so a
+    flaky prefetch can never surface in the search result.
+    """
+    try:
+        await asyncio.gather(get_similar_manga(id), get_manga_news(id))
     except Exception as e:
-        logger.error(f"Error occured while getting manga news: {e}", exc_info=True)
-        raise
\ No newline at end of file
+        logger.warning("Prefetch for manga %s failed: %s", id, e)
@@ -7,6 +7,15 @@ import src.tools.anime_related_tools
 import src.tools.manga_related_tools  
 import src.tools.producer_related_tools
 
+# Use uvloop's libuv-backed event loop when available; the tools are
+# I/O-bound and scheduling many short coroutines, where it cuts loop
+# overhead noticeably. Falls back silently to the default loop.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 def main() -> None:
     """Run the MyAnimeList MCP server with stdio transport.
     
@@ -0,0 +1,61 @@
+import json
+import time
+from typing import Any, Optional
+
+# Default TTLs (in seconds) per Jikan resource type. Rankings and seasonal
+# charts change slowly, news churns faster, and random results are never
+# cached at all.
+SEARCH_TTL = 60 * 60
+TOP_TTL = 6 * 60 * 60
+SEASONAL_TTL = 24 * 60 * 60
+REVIEWS_TTL = 60 * 60
+RECOMMENDATIONS_TTL = 6 * 60 * 60
+NEWS_TTL = 15 * 60
+PRODUCER_TTL = 6 * 60 * 60
+
+
+class TTLCache:
+    """Small in-memory TTL cache for Jikan API results.
+
+    Entries expire after their per-entry TTL and the oldest entry is
+    evicted once the cache is full. The server is a single process, so a
+    plain dict is enough - no external cache service is needed.
+
+    Example:
+        cache = TTLCache(maxsize=1024)
+        cache.set("key", value, ttl=3600)
+        value = cache.get("key")
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds. A non-positive ttl skips caching."""
+        if ttl <= 0:
+            return
+        if key not in self._entries and len(self._entries) >= self._maxsize:
+            # Dicts preserve insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+
+def cache_key(tool: str, params: dict) -> str:
+    """Build a canonical cache key from a tool name and its normalized params."""
+    return f"{tool}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+# Shared cache instance for all Jikan tools
+jikan_cache = TTLCache()
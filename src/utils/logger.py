@@ -24,10 +24,16 @@ def setup_logger(name: str = "MAL_MCPServer", log_file: str = "mal_mcp_server.lo
     if logger.handlers:
         return logger
     
-    # File handler with DEBUG level
-    file_handler = logging.FileHandler(log_file)
+    # File handler with DEBUG level; delay=True defers opening the file
+    # until the first record, so importing the module costs no file I/O
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter("%(asctime)s - %(filename)s - %(name)s - %(levelname)s - %(message)s")
+    # Explicit datefmt skips the per-record millisecond merge the default
+    # asctime formatting performs on every emitted line
+    file_formatter = logging.Formatter(
+        "%(asctime)s - %(filename)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
     file_handler.setFormatter(file_formatter)
     logger.addHandler(file_handler)
     
@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=256)
+def _dump_cached(params: BaseModel) -> dict:
+    return params.model_dump(exclude_none=True)
+
+
+def to_query(params: BaseModel) -> dict:
+    """Return the model's non-None fields as an HTTP query dict.
+
+    Tool parameter models are frozen (hashable), so the expensive
+    model_dump call is memoized per distinct parameter combination.
+    Defaulted invocations - by far the most common - hit the cache after
+    the first call. A shallow copy is returned so callers can't mutate
+    the cached dict.
+
+    Args:
+        params (BaseModel): A frozen tool parameter model
+
+    Returns:
+        dict: Field name to value mapping with None values excluded
+    """
+    return dict(_dump_cached(params))